@@ -44,6 +44,13 @@ from evohome_rf.schema import (
     SERIAL_PORT,
 )
 
+try:  # optional: a drop-in, C-implemented event loop (not available on win32)
+    import uvloop
+
+    uvloop.install()
+except ImportError:
+    uvloop = None
+
 DEBUG_MODE = "debug_mode"
 
 COMMAND = "command"
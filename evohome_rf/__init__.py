@@ -61,6 +61,8 @@ class Gateway:
 
         self._loop = loop if loop else asyncio.get_running_loop()
         self._tasks = []
+        self._send_q = asyncio.Queue()  # drained by a single, long-lived _send_loop
+        self._send_task = None
 
         self.serial_port = serial_port
         self._input_file = input_file
@@ -93,10 +95,14 @@ class Gateway:
 
         # if self.config[REDUCE_PROCESSING] > 0:
         self.evo = None  # Evohome(controller=config["controller_id"])
+        self._schema_ver = 0  # incremented whenever the schema may have changed
+        self._str_cache = None
+        self._str_ver = None  # _schema_ver when the cache was serialized
         self.systems: List[SystemBase] = []
         self.system_by_id: Dict = {}
         self.devices: List[Device] = []
         self.device_by_id: Dict = {}
+        self._sensor_candidates: Dict = {}  # possible zone sensors, by ctl id
 
         self._prev_msg = None
 
@@ -112,7 +118,11 @@ class Gateway:
 
     def __str__(self) -> str:
         """Return a brief readable string representation of this object."""
-        return json.dumps(self.schema, indent=2)
+        # serializing the schema is O(zones + devices) - cache it per version
+        if self._str_ver != self._schema_ver:
+            self._str_cache = json.dumps(self.schema, indent=2)
+            self._str_ver = self._schema_ver
+        return self._str_cache
 
     def _setup_event_handlers(self):
         def handle_exception(loop, context):
@@ -235,11 +245,22 @@ class Gateway:
 
             if domain_id in ("F9", "FA", "FC", "FF"):
                 device._domain_id = domain_id
+                self._schema_ver += 1
             elif domain_id is not None and ctl is not None:
                 device._set_zone(ctl._evo._get_zone(domain_id))
 
         return device
 
+    async def schema_json(self, **kwargs) -> str:
+        """Return the global schema as JSON, serialized off the event loop.
+
+        Serializing a large topology can take long enough to stall the loop's
+        I/O - offload it to the default executor.
+        """
+        return await self._loop.run_in_executor(
+            None, lambda: json.dumps(self.schema, **kwargs)
+        )
+
     @property
     def schema(self) -> dict:
         """Return the global schema."""
@@ -282,10 +303,25 @@ class Gateway:
         """Create a client protocol for the RAMSES-II message transport."""
         return create_msg_stack(self, msg_handler)
 
-    def send_data(self, data) -> asyncio.Task:
+    async def _send_loop(self) -> None:
+        """Drain the send queue - one long-lived task services all sends."""
+        while True:
+            await self.msg_protocol.send_data(await self._send_q.get())
+
+    def send_data(self, data) -> None:
         # TODO: validate data to be sent is cmd or !X
+        if not self.msg_protocol:
+            raise RuntimeError("there is no message protocol client")
+
+        if self._send_task is None:  # one reused task, not one task per send
+            self._send_task = self._loop.create_task(self._send_loop())
+
+        self._send_q.put_nowait(data)
+
+    def send_cmds(self, cmds) -> asyncio.Task:
+        """Send a batch of commands with a single task/buffer submission."""
         if self.msg_protocol:
-            task = self._loop.create_task(self.msg_protocol.send_data(data))
+            task = self._loop.create_task(self.msg_protocol.send_data_many(list(cmds)))
         else:
             raise RuntimeError("there is no message protocol client")
 
@@ -7,11 +7,14 @@ Construct a command (packet that is to be sent).
 """
 
 import asyncio
-from datetime import datetime as dt, timedelta as td
-from functools import total_ordering
+from collections import OrderedDict
+from datetime import timedelta as td
+from functools import lru_cache, total_ordering
 import json
 import logging
+import re
 import struct
+import time
 from types import SimpleNamespace
 from typing import Optional
 import zlib
@@ -23,12 +26,13 @@ from .const import (
     COMMAND_FORMAT,
     COMMAND_REGEX,
     HGI_DEVICE,
+    NON_DEVICE,
     SYSTEM_MODE_LOOKUP,
     ZONE_MODE_LOOKUP,
     ZONE_MODE_MAP,
 )
 from .exceptions import ExpiredCallbackError
-from .helpers import dt_now, dtm_to_hex, extract_addrs, str_to_hex, temp_to_hex
+from .helpers import dtm_to_hex, str_to_hex, temp_to_hex
 
 DAY_OF_WEEK = "day_of_week"
 HEAT_SETPOINT = "heat_setpoint"
@@ -41,55 +45,185 @@ ZONE_IDX = "zone_idx"
 TIMER_SHORT_SLEEP = 0.05
 TIMER_LONG_TIMEOUT = td(seconds=60)
 
+MAX_FAULT_LOG_ENTRIES = 0x3C  # 10 pages of 6 entries
+
 FIVE_MINS = td(minutes=5)
 
+# a 20-byte schedule switchpoint: zone_idx, day_of_week, time_of_day, setpoint
+_SCHED_RECORD = struct.Struct("<xxxxBxxxBxxxHxxHH")
+_SCHED_RECORD_W = struct.Struct("<xxxxBxxxBxxxHxxHxx")  # as sent (pad, not unknown)
+
 
 Priority = SimpleNamespace(LOWEST=8, LOW=6, DEFAULT=4, HIGH=2, HIGHEST=0)
 
+# the non-default QoS profiles, keyed by (verb, code) - the defaults for the
+# rest are in packet.py
+_QOS_TABLE = {
+    ("RQ", "0016"): {"priority": Priority.HIGH, "retries": 5},
+    ("RQ", "1F09"): {"priority": Priority.HIGH, "retries": 5},
+    ("RQ", "0404"): {
+        "priority": Priority.HIGH,
+        "retries": 3,
+        "timeout": td(seconds=0.30),
+    },
+    (" W", "0404"): {
+        "priority": Priority.HIGH,
+        "retries": 3,
+        "timeout": td(seconds=0.30),
+    },
+    ("RQ", "0418"): {"priority": Priority.LOW, "retries": 3},
+}
+_QOS_DEFAULT = {"priority": Priority.DEFAULT, "retries": 3}
+
 DEV_MODE = _dev_mode_
 
 _LOGGER = logging.getLogger(__name__)
 if DEV_MODE:
     _LOGGER.setLevel(logging.DEBUG)
 
+_HEX_CHARS = "0123456789ABCDEF"
+
+_UNSET = object()  # sentinel: "not computed yet" (None means computed, but null)
+
+
+@lru_cache(maxsize=1024)
+def _check_signature(verb, from_addr, dest_addr, code, payload_len) -> bool:
+    """Return True if the command signature matches COMMAND_REGEX.
+
+    The match is keyed on the command's structural signature (the payload is
+    represented by its length only), so commands of a duplicate shape skip the
+    regex entirely - the payload itself is hex-checked by the caller.
+    """
+    cmd = COMMAND_FORMAT.format(
+        verb, from_addr, dest_addr, code, payload_len, "00" * payload_len
+    )
+    return COMMAND_REGEX.match(cmd) is not None
+
+
+_PKT_HDR_RE = re.compile(
+    r"^\S{3} (?P<verb> I|RP|RQ| W) \S{3} "
+    r"(?P<addr0>\S{9}) (?P<addr1>\S{9}) (?P<addr2>\S{9}) "
+    r"(?P<code>[0-9A-F]{4}) \d{3} (?P<payload>\S+)$"
+)
+
 
+@lru_cache(maxsize=4096)
 def _pkt_header(pkt: str, rx_header=None) -> Optional[str]:
-    """Return the QoS header of a packet."""
+    """Return the QoS header of a packet.
+
+    The packet has already been validated by the caller (Packet.is_valid), so
+    a single pre-compiled regex is sufficient to extract the fields; results
+    are memoized. Commands bypass this parse - they know their own fields and
+    use _hdr_from_fields directly.
+    """
+
+    fields = _PKT_HDR_RE.match(pkt).groupdict()
+
+    # the src addr is the 1st device addr, the dst addr is the 2nd (if any)
+    addrs = [
+        a for a in (fields["addr0"], fields["addr1"], fields["addr2"]) if a[:2] != "--"
+    ]
+    if addrs[0][:2] == "18":
+        addr = addrs[1] if len(addrs) > 1 else NON_DEVICE.id
+    else:
+        addr = addrs[0]
+
+    return _hdr_from_fields(
+        fields["verb"], addr, fields["code"], fields["payload"], rx_header=rx_header
+    )
+
+
+def _hdr_default(header, payload, rx_header) -> Optional[str]:
+    return "|".join((header, payload[:2]))  # assume has a domain_id
+
+
+def _hdr_no_rp(header, payload, rx_header) -> Optional[str]:
+    return None if rx_header else _hdr_default(header, payload, rx_header)
+
+
+def _hdr_zone_cls(header, payload, rx_header) -> Optional[str]:
+    return "|".join((header, payload[:4]))  # zone_idx, device_class
+
+
+def _hdr_sched(header, payload, rx_header) -> Optional[str]:
+    return "|".join((header, payload[:2] + payload[10:12]))  # zone_idx, frag_idx
+
+
+def _hdr_faults(header, payload, rx_header) -> Optional[str]:
+    if payload == CODE_SCHEMA["0418"]["null_rp"]:
+        return header
+    return "|".join((header, payload[4:6]))  # log_idx
+
+
+def _hdr_sans_domain(header, payload, rx_header) -> Optional[str]:
+    return header  # these codes have no domain_id
+
+
+_HDR_HANDLERS = {
+    "0001": _hdr_no_rp,
+    "7FFF": _hdr_no_rp,
+    "0005": _hdr_zone_cls,
+    "000C": _hdr_zone_cls,
+    "0404": _hdr_sched,
+    "0418": _hdr_faults,
+}
+for _code in CODES_SANS_DOMAIN_ID:
+    _HDR_HANDLERS.setdefault(_code, _hdr_sans_domain)  # 0418 keeps its handler
+del _code
+
+
+def _hdr_from_fields(verb, addr, code, payload, rx_header=None) -> Optional[str]:
+    """Return the QoS header from a packet's already-extracted fields."""
 
-    verb = pkt[4:6]
     if rx_header:
         verb = "RP" if verb == "RQ" else " I"  # RQ/RP, or W/I
-    code = pkt[41:45]
-    src, dst, _ = extract_addrs(pkt)
-    addr = dst.id if src.type == "18" else src.id
-    payload = pkt[50:]
 
     header = "|".join((verb, addr, code))
 
-    if code in ("0001", "7FFF") and rx_header:
-        return
+    return _HDR_HANDLERS.get(code, _hdr_default)(header, payload, rx_header)
 
-    if code in ("0005", "000C"):  # zone_idx, device_class
-        return "|".join((header, payload[:4]))
 
-    if code == "0404":  # zone_schedule: zone_idx, frag_idx
-        return "|".join((header, payload[:2] + payload[10:12]))
+class Callback:
+    """A callback to invoke when the response (or no response) arrives.
 
-    if code == "0418":  # fault_log: log_idx
-        if payload == CODE_SCHEMA["0418"]["null_rp"]:
-            return header
-        return "|".join((header, payload[4:6]))
+    A slotted object rather than a dict - one allocation per request instead
+    of a dict plus its args/kwargs sub-containers.
+    """
 
-    if code in CODES_SANS_DOMAIN_ID:  # have no domain_id
-        return header
+    __slots__ = ("func", "timeout", "daemon", "args", "kwargs", "expires")
 
-    return "|".join((header, payload[:2]))  # assume has a domain_id
+    def __init__(self, func, timeout=None, daemon=False, args=(), kwargs=None):
+        self.func = func
+        self.timeout = timeout  # a timedelta, relative to the time of dispatch
+        self.daemon = daemon  # a daemon callback is never discarded
+        self.args = args
+        self.kwargs = kwargs if kwargs is not None else {}
+        self.expires = None  # an absolute dtm, set when the command is sent
 
 
 @total_ordering
 class Command:
     """The command class."""
 
+    # effectively immutable once constructed - slots halve the per-instance
+    # memory, which adds up when thousands of commands are queued
+    __slots__ = (
+        "verb",
+        "from_addr",
+        "dest_addr",
+        "code",
+        "payload",
+        "_payload_len",
+        "callback",
+        "qos",
+        "_str",
+        "_is_valid",
+        "_priority",
+        "_priority_dtm",
+        "_rx_header",
+        "_tx_header",
+    )
+
     def __init__(self, verb, dest_addr, code, payload, **kwargs) -> None:
         """Initialise the class."""
 
@@ -100,67 +234,62 @@ class Command:
         self.dest_addr = dest_addr if dest_addr is not None else self.from_addr
         self.code = code
         self.payload = payload
+        self._payload_len = len(payload) >> 1  # in bytes, not hex chars
+
+        # the Command is immutable once constructed, so format it only once
+        self._str = COMMAND_FORMAT.format(
+            self.verb,
+            self.from_addr,
+            self.dest_addr,
+            self.code,
+            self._payload_len,
+            payload,
+        )
 
         self._is_valid = None
         if not self.is_valid:
             raise ValueError(f"Invalid parameter values for command: {self}")
 
-        self.callback = kwargs.get("callback", {})  # TODO: use voluptuous
-        if self.callback:
-            self.callback["args"] = self.callback.get("args", [])
-            self.callback["kwargs"] = self.callback.get("kwargs", {})
+        self.callback = kwargs.get("callback")  # a Callback instance, or None
 
-        self.qos = self._qos
-        self.qos.update(kwargs.get("qos", {}))
-        self._priority = self.qos["priority"]
-        self._priority_dtm = dt_now()  # used for __lt__, etc.
+        # a copy of the table entry, as the caller may update it with its own
+        qos = dict(_QOS_TABLE.get((self.verb, self.code), _QOS_DEFAULT))
+        qos.update(kwargs.get("qos", {}))
+        self.qos = qos
+        self._priority = qos["priority"]
+        self._priority_dtm = time.monotonic_ns()  # used for __lt__, etc.
 
-        self._rx_header = None
+        self._rx_header = _UNSET
         self._tx_header = None
 
     def __str__(self) -> str:
         """Return a brief readable string representation of this object."""
-
-        return COMMAND_FORMAT.format(
-            self.verb,
-            self.from_addr,
-            self.dest_addr,
-            self.code,
-            int(len(self.payload) / 2),
-            self.payload,
-        )
+        return self._str
 
     @property
-    def _qos(self) -> dict:
-        """Return the QoS params of this (request) packet."""
-
-        # the defaults for these are in packet.py
-        # qos = {"priority": Priority.DEFAULT, "retries": 3, "timeout": td(seconds=0.5)}
-        qos = {"priority": Priority.DEFAULT, "retries": 3}
-
-        if self.code in ("0016", "1F09") and self.verb == "RQ":
-            qos.update({"priority": Priority.HIGH, "retries": 5})
-
-        elif self.code == "0404" and self.verb in ("RQ", " W"):
-            qos.update({"priority": Priority.HIGH, "timeout": td(seconds=0.30)})
-
-        elif self.code == "0418" and self.verb == "RQ":
-            qos.update({"priority": Priority.LOW, "retries": 3})
-
-        return qos
+    def _hdr_addr(self) -> str:
+        # for packets sent by the gateway (src type 18), the dst addr is used
+        return self.dest_addr if self.from_addr[:2] == "18" else self.from_addr
 
     @property
     def tx_header(self) -> str:
         """Return the QoS header of this (request) packet."""
         if self._tx_header is None:
-            self._tx_header = _pkt_header(f"... {self}")
+            self._tx_header = _hdr_from_fields(
+                self.verb, self._hdr_addr, self.code, self.payload
+            )
         return self._tx_header
 
     @property
     def rx_header(self) -> Optional[str]:
         """Return the QoS header of a response packet (if any)."""
-        if self.tx_header and self._rx_header is None:
-            self._rx_header = _pkt_header(f"... {self}", rx_header=True)
+        if self._rx_header is _UNSET:  # a null header (None) is also memoized
+            if self.tx_header:
+                self._rx_header = _hdr_from_fields(
+                    self.verb, self._hdr_addr, self.code, self.payload, rx_header=True
+                )
+            else:
+                self._rx_header = None
         return self._rx_header
 
     # @property
@@ -177,12 +306,13 @@ class Command:
         if self._is_valid is not None:
             return self._is_valid
 
-        if not COMMAND_REGEX.match(str(self)):
-            self._is_valid = False
-        elif 0 > len(self.payload) > 96:
+        payload = self.payload
+        if not 0 < len(payload) <= 96 or len(payload) % 2 or payload.strip(_HEX_CHARS):
             self._is_valid = False
         else:
-            self._is_valid = True
+            self._is_valid = _check_signature(
+                self.verb, self.from_addr, self.dest_addr, self.code, self._payload_len
+            )
 
         if not self._is_valid:
             _LOGGER.debug("Command has an invalid structure: %s", self)
@@ -191,7 +321,7 @@ class Command:
 
     @staticmethod
     def _is_valid_operand(other) -> bool:
-        return hasattr(other, "_priority") and hasattr(other, "_priority_dtm")
+        return isinstance(other, Command)  # a C-level check, not hasattr probes
 
     def __eq__(self, other) -> bool:
         if not self._is_valid_operand(other):
@@ -226,9 +356,7 @@ class Command:
         assert overrun is None or 0 <= overrun <= 10, overrun
         assert differential is None or 1 <= differential <= 10, differential
 
-        payload += temp_to_hex(setpoint)
-        payload += f"{overrun:02X}"
-        payload += temp_to_hex(differential)
+        payload += f"{temp_to_hex(setpoint)}{overrun:02X}{temp_to_hex(differential)}"
 
         return cls(" W", ctl_id, "10A0", payload)
 
@@ -267,11 +395,16 @@ class Command:
         assert 0 <= valve_run_time <= 240, valve_run_time
         assert 0 <= pump_run_time <= 99, pump_run_time
 
-        payload += f"C801{max_flow_setpoint:02X}"
-        payload += f"C901{min_flow_setpoint:02X}"
-        payload += f"CA01{valve_run_time:02X}"
-        payload += f"CB01{pump_run_time:02X}"
-        payload += f"CC01{1:02X}"
+        # fmt: off
+        payload += struct.pack(
+            ">BBBBBBBBBBBBBBB",
+            0xC8, 1, max_flow_setpoint,
+            0xC9, 1, min_flow_setpoint,
+            0xCA, 1, valve_run_time,
+            0xCB, 1, pump_run_time,
+            0xCC, 1, 1,
+        ).hex().upper()  # one buffer + one hex(), not 5 f-string temporaries
+        # fmt: on
 
         return cls(" W", ctl_id, "1030", payload)
 
@@ -317,10 +450,10 @@ class Command:
             proportional_band_width is None or 1.5 <= proportional_band_width <= 3.0
         ), proportional_band_width
 
-        payload += f"{cycle_rate * 4:02X}"
-        payload += f"{int(min_on_time * 4):02X}"
-        payload += f"{int(min_off_time * 4):02X}FF"
-        payload += f"{temp_to_hex(proportional_band_width)}01"
+        payload += struct.pack(
+            ">BBB", cycle_rate * 4, int(min_on_time * 4), int(min_off_time * 4)
+        ).hex().upper()
+        payload += f"FF{temp_to_hex(proportional_band_width)}01"
 
         return cls(" W", ctl_id, "1100", payload)
 
@@ -349,9 +482,7 @@ class Command:
         bitmap |= 0 if openwindow_function else 2
         bitmap |= 0 if multiroom_mode else 16
 
-        payload += f"{bitmap}"
-        payload += temp_to_hex(min_temp)
-        payload += temp_to_hex(max_temp)
+        payload += f"{bitmap}{temp_to_hex(min_temp)}{temp_to_hex(max_temp)}"
 
         return cls(" W", ctl_id, "000A", payload)
 
@@ -404,7 +535,7 @@ class Command:
 
         payload = f"{zone_idx:02X}" if isinstance(zone_idx, int) else zone_idx
 
-        payload += f"00{str_to_hex(name)[:24]:0<40}"  # TODO: check limit 12 (24)?
+        payload += "00" + str_to_hex(name)[:24].ljust(40, "0")  # TODO: limit 12 (24)?
 
         return cls(" W", ctl_id, "0004", payload)
 
@@ -433,9 +564,14 @@ class FaultLog:  # 0418
         self._gwy = ctl._gwy
 
         self._fault_log = None
+        self._fault_log_cached = None
         self._fault_log_done = None
+        self._done_evt = asyncio.Event()  # set when the last entry is in
 
         self._limit = 11  # TODO: make configurable
+        self._window = 4  # log-entry RQs kept in flight (each is ~1 RF round-trip)
+        self._in_flight = 0
+        self._next_idx = 0
 
     def __repr_(self) -> str:
         return json.dumps(self._fault_log) if self._fault_log_done else None
@@ -449,27 +585,34 @@ class FaultLog:  # 0418
         if not self._fault_log_done:
             return
 
-        result = {
-            x: {k: v for k, v in y.items() if k[:1] != "_"}
-            for x, y in self._fault_log.items()
-        }
+        if self._fault_log_cached is None:  # one pass, then cached until refreshed
+            self._fault_log_cached = {
+                x: [v for k, v in y.items() if k[:1] != "_" and k != "log_idx"]
+                for x, y in self._fault_log.items()
+            }
 
-        return {k: [x for x in v.values()] for k, v in result.items()}
+        return self._fault_log_cached
 
     async def get_fault_log(self, force_refresh=None) -> Optional[dict]:
         """Get the fault log of a system."""
         _LOGGER.debug("FaultLog(%s).get_fault_log()", self)
 
-        self._fault_log = {}
+        self._fault_log = OrderedDict()  # a ring buffer - oldest entries evicted
+        self._fault_log_cached = None
         self._fault_log_done = None
+        self._done_evt.clear()
 
-        self._rq_log_entry(log_idx=0)  # calls loop.create_task()
+        self._in_flight = 0
+        self._next_idx = 0
+        for log_idx in range(min(self._window, self._limit + 1)):
+            self._rq_log_entry(log_idx)  # pipelined - responses are keyed by log_idx
 
-        time_start = dt.now()
-        while not self._fault_log_done:
-            await asyncio.sleep(TIMER_SHORT_SLEEP)
-            if dt.now() > time_start + TIMER_LONG_TIMEOUT * 2:
-                raise ExpiredCallbackError("failed to obtain log entry (long)")
+        try:  # wait to be signalled by the callback (was: poll every 50 ms)
+            await asyncio.wait_for(
+                self._done_evt.wait(), timeout=TIMER_LONG_TIMEOUT.total_seconds() * 2
+            )
+        except asyncio.TimeoutError:
+            raise ExpiredCallbackError("failed to obtain log entry (long)")
 
         return self.fault_log
 
@@ -482,33 +625,40 @@ class FaultLog:  # 0418
 
             if not msg:
                 self._fault_log_done = True
+                self._done_evt.set()
                 # raise ExpiredCallbackError("failed to obtain log entry (short)")
                 return
 
-            log = dict(msg.payload)
-            log_idx = int(log.pop("log_idx"), 16)
-            if not log:  # null response (no payload)
+            log = msg.payload  # stored as-is - no copy per entry
+            log_idx = int(log["log_idx"], 16)
+            if len(log) == 1:  # null response (no payload other than log_idx)
                 # TODO: delete other callbacks rather than waiting for them to expire
                 self._fault_log_done = True
+                self._done_evt.set()
                 return
 
             self._fault_log[log_idx] = log
-            if log_idx < self._limit:
-                self._rq_log_entry(log_idx + 1)
-            else:
+            self._fault_log.move_to_end(log_idx)
+            if len(self._fault_log) > MAX_FAULT_LOG_ENTRIES:
+                self._fault_log.popitem(last=False)  # bound memory/serialization
+            self._in_flight -= 1
+            if self._next_idx <= self._limit:  # top up the window
+                self._rq_log_entry(self._next_idx)
+            elif not self._in_flight:  # all entries requested, and all are in
                 self._fault_log_done = True
+                self._done_evt.set()
 
         # TODO: (make method) register callback for null response (no payload)
         null_header = "|".join(("RP", self.id, "0418"))
         if null_header not in self._gwy.msg_transport._callbacks:
-            self._gwy.msg_transport._callbacks[null_header] = {
-                "func": rq_callback,
-                "daemon": True,
-                "args": [],
-                "kwargs": {},
-            }
+            self._gwy.msg_transport._callbacks[null_header] = Callback(
+                rq_callback, daemon=True
+            )
+
+        self._in_flight += 1
+        self._next_idx = log_idx + 1
 
-        rq_callback = {"func": rq_callback, "timeout": td(seconds=10)}
+        rq_callback = Callback(rq_callback, timeout=td(seconds=10))
         self._gwy.send_data(
             Command("RQ", self._ctl.id, "0418", f"{log_idx:06X}", callback=rq_callback)
         )
@@ -530,12 +680,19 @@ class Schedule:  # 0404
         self._evo = zone._evo
         self._gwy = zone._gwy
 
+        # the constant part of the 0404 payloads (DHW would be: 23000800)
+        self._frag_prefix = f"{self.idx}200008"
+
         self._schedule = None
         self._schedule_done = None
+        self._done_evt = asyncio.Event()  # set when the last fragment is in
 
         # initialse the fragment array()
         self._num_frags = None
         self._rx_frags = None
+        self._rx_complete = False  # True when no fragment is missing
+        self._n_pending = 0  # count of empty fragment slots
+        self._rx_in_flight = set()  # (0-based) indices with an RQ outstanding
         self._tx_frags = None
 
     def __repr_(self) -> str:
@@ -547,7 +704,7 @@ class Schedule:  # 0404
     @property
     def schedule(self) -> Optional[dict]:
         """Return the schedule of a zone."""
-        if not self._schedule_done or None in self._rx_frags:
+        if not self._rx_complete:  # O(1), not a scan of the fragment list
             return
         if self._schedule:
             return self._schedule
@@ -555,7 +712,7 @@ class Schedule:  # 0404
         if self._rx_frags[0]["msg"].payload["frag_total"] == 255:
             return {}
 
-        frags = [v for d in self._rx_frags for k, v in d.items() if k == "fragment"]
+        frags = [d["fragment"] for d in self._rx_frags]
 
         try:
             self._schedule = self._frags_to_sched(frags)
@@ -570,28 +727,31 @@ class Schedule:  # 0404
         """Get the schedule of a zone."""
         _LOGGER.debug(f"Schedule({self.id}).get_schedule()")
 
-        if not await self._obtain_lock():  # TODO: should raise a TimeOut
-            return
+        async with self._evo.zone_lock:  # released even if we raise
+            if force_refresh:
+                self._schedule_done = None
 
-        if force_refresh:
-            self._schedule_done = None
-
-        if not self._schedule_done:
-            self._rq_fragment(frag_cnt=0)  # calls loop.create_task()
+            if not self._schedule_done:
+                self._done_evt.clear()
+                self._rq_fragment(frag_cnt=0)  # calls loop.create_task()
 
-            time_start = dt.now()
-            while not self._schedule_done:
-                await asyncio.sleep(TIMER_SHORT_SLEEP)
-                if dt.now() > time_start + TIMER_LONG_TIMEOUT:
-                    self._release_lock()
+                try:  # wait to be signalled by the callback
+                    await asyncio.wait_for(
+                        self._done_evt.wait(),
+                        timeout=TIMER_LONG_TIMEOUT.total_seconds(),
+                    )
+                except asyncio.TimeoutError:
                     raise ExpiredCallbackError("failed to get schedule")
 
-        self._release_lock()
-
         return self.schedule
 
     def _rq_fragment(self, frag_cnt=0) -> None:
-        """Request the next missing fragment (index starts at 1, not 0)."""
+        """Request all missing fragments (index starts at 1, not 0).
+
+        The RQs are pipelined: once the first response reveals frag_total, the
+        remaining fragments are requested in parallel (the QoS header carries
+        the frag_idx, so the responses can arrive in any order).
+        """
         _LOGGER.debug("Schedule(%s)._rq_fragment(%s)", self.id, frag_cnt)
 
         def rq_callback(msg) -> None:
@@ -599,6 +759,7 @@ class Schedule:  # 0404
                 # TODO: remove any callbacks from msg._gwy.msg_transport._callbacks
                 _LOGGER.warning(f"Schedule({self.id}): Callback timed out")
                 self._schedule_done = True
+                self._done_evt.set()
                 return
 
             _LOGGER.debug(
@@ -614,25 +775,36 @@ class Schedule:  # 0404
 
             elif msg.payload["frag_total"] != len(self._rx_frags):  # e.g. 1st frag
                 self._rx_frags = [None] * msg.payload["frag_total"]
+                self._n_pending = msg.payload["frag_total"]
 
+            self._rx_in_flight.discard(msg.payload["frag_index"] - 1)
+            if self._rx_frags[msg.payload["frag_index"] - 1] is None:
+                self._n_pending -= 1
             self._rx_frags[msg.payload["frag_index"] - 1] = {
-                "fragment": msg.payload["fragment"],
+                "fragment": bytes.fromhex(msg.payload["fragment"]),  # decoded once
                 "msg": msg,
             }
 
             # discard any fragments significantly older that this most recent fragment
-            for frag in [f for f in self._rx_frags if f is not None]:
-                frag = None if frag["msg"].dtm < msg.dtm - FIVE_MINS else frag
-
-            if None in self._rx_frags:  # there are still frags to get
+            cutoff = msg.dtm - FIVE_MINS
+            frags = self._rx_frags
+            for i, f in enumerate(frags):
+                if f is not None and f["msg"].dtm < cutoff:
+                    frags[i] = None  # in place - the slot will be re-requested
+                    self._n_pending += 1
+
+            if self._n_pending:  # there are still frags to get (was: None in ...)
                 self._rq_fragment(frag_cnt=msg.payload["frag_total"])
             else:
+                self._rx_complete = True
                 self._schedule_done = True
+                self._done_evt.set()
 
         if frag_cnt == 0:
             self._rx_frags = [None]  # and: frag_idx = 0
-
-        frag_idx = next((i for i, f in enumerate(self._rx_frags) if f is None), -1)
+            self._rx_complete = False
+            self._n_pending = 1
+            self._rx_in_flight = set()
 
         # 053 RQ --- 30:185469 01:037519 --:------ 0006 001 00
         # 045 RP --- 01:037519 30:185469 --:------ 0006 004 000500E6
@@ -644,30 +816,38 @@ class Schedule:  # 0404
         # 059 RQ --- 30:185469 01:037519 --:------ 0404 007 00-23000800 0304
         # 046 RP --- 01:037519 30:185469 --:------ 0404 048 00-23000829 0304 6BE...
 
-        payload = f"{self.idx}20000800{frag_idx + 1:02X}{frag_cnt:02X}"  # DHW: 23000800
-        rq_callback = {"func": rq_callback, "timeout": td(seconds=1)}
-        self._gwy.send_data(
-            Command("RQ", self._ctl.id, "0404", payload, callback=rq_callback)
-        )
+        for frag_idx, frag in enumerate(self._rx_frags):
+            if frag is not None or frag_idx in self._rx_in_flight:
+                continue
+            self._rx_in_flight.add(frag_idx)
+            payload = f"{self._frag_prefix}00{frag_idx + 1:02X}{frag_cnt:02X}"
+            self._gwy.send_data(
+                Command(
+                    "RQ",
+                    self._ctl.id,
+                    "0404",
+                    payload,
+                    callback=Callback(rq_callback, timeout=td(seconds=1)),
+                )
+            )
 
     @staticmethod
     def _frags_to_sched(frags: list) -> dict:
-        # _LOGGER.debug(f"Sched({self})._frags_to_sched: array is: %s", frags)
-        raw_schedule = zlib.decompress(bytearray.fromhex("".join(frags)))
+        """Decode a list of (binary) schedule fragments into a schedule dict."""
+        # the fragments were hex-decoded on receipt - join bytes, not hex chars
+        raw_schedule = zlib.decompress(b"".join(frags))
 
         zone_idx, schedule = None, []
         old_day, switchpoints = 0, []
 
-        for i in range(0, len(raw_schedule), 20):
-            zone_idx, day, time, temp, _ = struct.unpack(
-                "<xxxxBxxxBxxxHxxHH", raw_schedule[i : i + 20]
-            )
+        # iter_unpack walks the whole buffer in C - no per-record slice/unpack
+        for zone_idx, day, tod, temp, _ in _SCHED_RECORD.iter_unpack(raw_schedule):
             if day > old_day:
                 schedule.append({DAY_OF_WEEK: old_day, SWITCHPOINTS: switchpoints})
                 old_day, switchpoints = day, []
             switchpoints.append(
                 {
-                    TIME_OF_DAY: "{0:02d}:{1:02d}".format(*divmod(time, 60)),
+                    TIME_OF_DAY: "{0:02d}:{1:02d}".format(*divmod(tod, 60)),
                     HEAT_SETPOINT: temp / 100,
                 }
             )
@@ -689,11 +869,12 @@ class Schedule:  # 0404
             for week_day in schedule[SCHEDULE]
             for setpoint in week_day[SWITCHPOINTS]
         ]
-        frags = [struct.pack("<xxxxBxxxBxxxHxxHxx", *s) for s in frags]
+        raw = b"".join(_SCHED_RECORD_W.pack(*s) for s in frags)
 
+        # compress the whole buffer in one call - zlib blocks better than when
+        # fed 20 bytes at a time, and there's one Python-level call, not N
         cobj = zlib.compressobj(level=9, wbits=14)
-        blob = b"".join([cobj.compress(s) for s in frags]) + cobj.flush()
-        blob = blob.hex().upper()
+        blob = (cobj.compress(raw) + cobj.flush()).hex().upper()
 
         return [blob[i : i + 82] for i in range(0, len(blob), 82)]
 
@@ -701,23 +882,20 @@ class Schedule:  # 0404
         """Set the schedule of a zone."""
         _LOGGER.debug(f"Schedule({self.id}).set_schedule(schedule)")
 
-        if not await self._obtain_lock():  # TODO: should raise a TimeOut
-            return
-
-        self._schedule_done = None
+        async with self._evo.zone_lock:  # released even if we raise
+            self._schedule_done = None
+            self._done_evt.clear()
 
-        self._tx_frags = self._sched_to_frags(schedule)
-        self._tx_fragment(frag_idx=0)
+            self._tx_frags = self._sched_to_frags(schedule)
+            self._tx_fragment(frag_idx=0)
 
-        time_start = dt.now()
-        while not self._schedule_done:
-            await asyncio.sleep(TIMER_SHORT_SLEEP)
-            if dt.now() > time_start + TIMER_LONG_TIMEOUT:
-                self._release_lock()
+            try:  # wait to be signalled by the callback
+                await asyncio.wait_for(
+                    self._done_evt.wait(), timeout=TIMER_LONG_TIMEOUT.total_seconds()
+                )
+            except asyncio.TimeoutError:
                 raise ExpiredCallbackError("failed to set schedule")
 
-        self._release_lock()
-
     def _tx_fragment(self, frag_idx=0) -> None:
         """Send the next fragment (index starts at 0)."""
         _LOGGER.debug(
@@ -735,35 +913,14 @@ class Schedule:  # 0404
                 self._tx_fragment(frag_idx=msg.payload.get("frag_index"))
             else:
                 self._schedule_done = True
+                self._done_evt.set()
 
-        payload = "{0}200008{1:02X}{2:02d}{3:02d}{4:s}".format(
-            self.idx,
-            int(len(self._tx_frags[frag_idx]) / 2),
-            frag_idx + 1,
-            len(self._tx_frags),
-            self._tx_frags[frag_idx],
+        frag = self._tx_frags[frag_idx]
+        payload = self._frag_prefix + (
+            f"{len(frag) >> 1:02X}{frag_idx + 1:02d}{len(self._tx_frags):02d}{frag}"
         )
-        tx_callback = {"func": tx_callback, "timeout": td(seconds=3)}  # 1 sec too low
+        tx_callback = Callback(tx_callback, timeout=td(seconds=3))  # 1 sec too low
         self._gwy.send_data(
             Command(" W", self._ctl.id, "0404", payload, callback=tx_callback)
         )
 
-    async def _obtain_lock(self) -> bool:  # Lock to prevent Rx/Tx at same time
-        while True:
-
-            self._evo.zone_lock.acquire()
-            if self._evo.zone_lock_idx is None:
-                self._evo.zone_lock_idx = self.idx
-            self._evo.zone_lock.release()
-
-            if self._evo.zone_lock_idx == self.idx:
-                break
-
-            await asyncio.sleep(0.1)  # gives the other zone enough time
-
-        return True
-
-    def _release_lock(self) -> None:
-        self._evo.zone_lock.acquire()
-        self._evo.zone_lock_idx = None
-        self._evo.zone_lock.release()
@@ -11,6 +11,7 @@ from .command import Command, Priority
 from .const import (
     _dev_mode_,
     DEVICE_HAS_BATTERY,
+    DEVICE_HAS_ZONE_SENSOR,
     DEVICE_TABLE,
     DEVICE_TYPES,
     DISCOVER_SCHEMA,
@@ -133,10 +134,13 @@ class DeviceBase(Entity, metaclass=ABCMeta):
         self.id = dev_addr.id
         gwy.devices.append(self)
         gwy.device_by_id[self.id] = self
+        gwy._schema_ver += 1
 
         self._ctl = None
         if ctl:
             self._set_ctl(ctl)
+        else:
+            self._index_sensor_candidate()
         self._domain_id = domain_id
 
         self.addr = dev_addr
@@ -182,6 +186,23 @@ class DeviceBase(Entity, metaclass=ABCMeta):
         payload = kwargs.pop("payload", "00")
         super()._send_cmd(code, dest, payload, **kwargs)
 
+    def _index_sensor_candidate(self) -> None:
+        """(Re-)file this device in the gateway's zone-sensor candidate index.
+
+        The index (keyed by controller id, None for orphans) saves the sensor
+        matching algorithm from scanning every device on each 30C9 array.
+        """
+
+        if self.id[:2] not in DEVICE_HAS_ZONE_SENSOR:
+            return
+
+        candidates = self._gwy._sensor_candidates
+        for devices in candidates.values():
+            if self in devices:
+                devices.remove(self)
+        key = self._ctl.id if self._ctl else None
+        candidates.setdefault(key, []).append(self)
+
     def _set_ctl(self, ctl) -> None:  # self._ctl
         """Set the device's parent controller, after validating it."""
 
@@ -195,6 +216,8 @@ class DeviceBase(Entity, metaclass=ABCMeta):
             self._ctl = ctl
             self._ctl.devices.append(self)
             self._ctl.device_by_id[self.id] = self
+            self._gwy._schema_ver += 1
+            self._index_sensor_candidate()
 
         elif self._ctl is not ctl:
             raise CorruptStateError(
@@ -417,6 +440,8 @@ class Device(DeviceInfo, DeviceBase):
         else:
             raise TypeError(f"paren can't be: {parent}")
 
+        self._gwy._schema_ver += 1
+
         if self._zone is not None:
             if self._zone is not parent:
                 raise CorruptStateError(
@@ -457,6 +482,7 @@ class Device(DeviceInfo, DeviceBase):
 
         self._domain_id = zone.idx
         self._zone = zone
+        self._gwy._schema_ver += 1
         if self._domain_id == "FA":
             # if isinstance(self, DhwSensor):
             #     self._sensor = self
@@ -214,8 +214,10 @@ async def scan_full(gwy, dev_id: str):
             gwy.send_data(Command("RQ", dev_id, code, "00200008000100", qos=qos))
 
         elif code == "0418":
-            for log_idx in range(2):
-                gwy.send_data(Command("RQ", dev_id, code, f"{log_idx:06X}", qos=qos))
+            gwy.send_cmds(
+                Command("RQ", dev_id, code, f"{log_idx:06X}", qos=qos)
+                for log_idx in range(2)
+            )
             continue
 
         elif code == "1100":
@@ -252,8 +254,10 @@ async def scan_hard(gwy, dev_id: str):
     _LOGGER.warning("scan_deep() invoked - expect some Warnings")
 
     qos = {"priority": Priority.LOW, "retries": 0}
-    for code in range(0x4000):
-        gwy.send_data(Command("RQ", dev_id, f"{code:04X}", "0000", qos=qos))
+    gwy.send_cmds(
+        Command("RQ", dev_id, f"{code:04X}", "0000", qos=qos)
+        for code in range(0x4000)
+    )
 
 
 async def scan_xxxx(gwy, dev_id: str):
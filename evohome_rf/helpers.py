@@ -22,6 +22,20 @@ from .const import (
 )
 
 
+class LazyStr:
+    """Defer an expensive %s logging argument until the record is emitted.
+
+    Wrap a zero-arg callable: it is only invoked if/when the logging handler
+    actually formats the message.
+    """
+
+    def __init__(self, fn) -> None:
+        self._fn = fn
+
+    def __str__(self) -> str:
+        return str(self._fn())
+
+
 class FILETIME(ctypes.Structure):
     """Data structure for GetSystemTimePreciseAsFileTime()."""
 
@@ -148,7 +162,7 @@ def temp_to_hex(value: int) -> str:
 
 def str_to_hex(value: str) -> str:
     """Convert a string to a variable-length ASCII hex string."""
-    return "".join([f"{ord(x):02X}" for x in value])
+    return value.encode("latin-1").hex().upper()  # C-level, not a per-char loop
 
 
 def is_valid_dev_id(value) -> bool:
@@ -73,7 +73,7 @@ class MessageTransport(asyncio.Transport):
         async def call_send_data(cmd):
             _LOGGER.debug("MsgTransport.pkt_dispatcher(%s): send_data", cmd)
             if cmd.callback:
-                cmd.callback["timeout"] = dt.now() + cmd.callback["timeout"]
+                cmd.callback.expires = dt.now() + cmd.callback.timeout
                 self._callbacks[cmd.rx_header] = cmd.callback
 
             await self._dispatcher(cmd)  # send_data, *once* callback registered
@@ -110,14 +110,14 @@ class MessageTransport(asyncio.Transport):
             hdr,
             callback,
         ) in self._callbacks.items():  # 1st, notify all expired callbacks
-            if callback.get("timeout", dt.max) < pkt._dtm:
+            if (callback.expires or dt.max) < pkt._dtm:
                 _LOGGER.error("MsgTransport._pkt_receiver(%s): Expired callback", hdr)
-                callback["func"](False, *callback["args"], **callback["kwargs"])
+                callback.func(False, *callback.args, **callback.kwargs)
 
         self._callbacks = {  # 2nd, discard expired callbacks
             hdr: callback
             for hdr, callback in self._callbacks.items()
-            if callback.get("daemon") or callback.get("timeout", dt.max) >= pkt._dtm
+            if callback.daemon or (callback.expires or dt.max) >= pkt._dtm
         }
 
         if len(self._protocols) == 0:
@@ -132,8 +132,8 @@ class MessageTransport(asyncio.Transport):
 
         if msg._pkt._header in self._callbacks:  # 3rd, invoke any callback
             callback = self._callbacks[msg._pkt._header]
-            callback["func"](msg, *callback["args"], **callback["kwargs"])
-            if not callback.get("daemon"):
+            callback.func(msg, *callback.args, **callback.kwargs)
+            if not callback.daemon:
                 del self._callbacks[msg._pkt._header]
 
         [p.data_received(msg) for p in self._protocols]
@@ -374,6 +374,13 @@ class MessageProtocol(asyncio.Protocol):
             await asyncio.sleep(0.005)
         self._transport.write(cmd)
 
+    async def send_data_many(self, cmds) -> None:
+        """Called when a batch of data is to be sent (not a callback)."""
+        _LOGGER.debug("MsgProtocol.send_data_many(%s)", cmds)
+        while self._pause_writing:
+            await asyncio.sleep(0.005)
+        self._transport.writelines(cmds)
+
     def connection_lost(self, exc: Optional[Exception]) -> None:
         """Called when the connection is lost or closed."""
         _LOGGER.debug("MsgProtocol.connection_lost(%s)", exc)
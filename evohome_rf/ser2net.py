@@ -4,6 +4,7 @@
 """Evohome RF - A raw ser2net (local) serial_port to (remote) network relay."""
 
 import asyncio
+from collections import deque
 import logging
 from string import printable
 from typing import Optional
@@ -36,27 +37,67 @@ DONT = 254  # Don't <option code>
 
 DEV_MODE = _dev_mode_
 
+# strip non-printable bytes in C (via bytes.translate), not per-char in Python
+_NON_PRINTABLE = bytes(b for b in range(256) if chr(b) not in printable)
+
 _LOGGER = logging.getLogger(__name__)
 if DEV_MODE:
     _LOGGER.setLevel(logging.DEBUG)
 
 
+class DequeQueue:
+    """A deque-backed, unbounded queue for the inbound command fan-in.
+
+    Cheaper than asyncio.Queue here: put_nowait is a C-level deque.append
+    plus an Event.set (no Future allocation), and the consumer drains all
+    pending items in one batch.
+    """
+
+    def __init__(self) -> None:
+        self._deque = deque()
+        self._event = asyncio.Event()
+
+    def put_nowait(self, item) -> None:
+        self._deque.append(item)
+        self._event.set()
+
+    async def get_all(self) -> list:
+        """Wait for, then return (and remove), all the queued items."""
+        while not self._deque:
+            self._event.clear()
+            await self._event.wait()
+        items = list(self._deque)
+        self._deque.clear()
+        return items
+
+
 class Ser2NetProtocol(asyncio.Protocol):
     """A TCP socket interface."""
 
-    def __init__(self, loop) -> None:
+    def __init__(self, loop, cmd_que) -> None:
         _LOGGER.debug("Ser2NetProtocol.__init__()")
 
         self._loop = loop
+        self._cmd_que = cmd_que
         self.transport = None
 
-        if RECV_TIMEOUT:
+        self._last_recv = None
+        self.timeout_handle = None
+
+    def _check_timeout(self):
+        """Close the socket if idle, else re-arm for the remaining interval.
+
+        A single long-lived timer re-armed from a timestamp, rather than a
+        cancel/reschedule per packet (which churns the loop's timer heap).
+        """
+        elapsed = self._loop.time() - self._last_recv
+        if elapsed < RECV_TIMEOUT:
             self.timeout_handle = self._loop.call_later(
-                RECV_TIMEOUT, self._recv_timeout
+                RECV_TIMEOUT - elapsed, self._check_timeout
             )
+            return
 
-    def _recv_timeout(self):
-        _LOGGER.debug("Ser2NetProtocol._recv_timeout()")
+        _LOGGER.debug("Ser2NetProtocol._check_timeout()")
         self.transport.close()
 
         _LOGGER.debug(" - socket closed by server (%ss of inactivity).", RECV_TIMEOUT)
@@ -65,6 +106,11 @@ class Ser2NetProtocol(asyncio.Protocol):
         _LOGGER.debug("Ser2NetProtocol.connection_made(%s)", transport)
 
         self.transport = transport
+        if RECV_TIMEOUT:
+            self._last_recv = self._loop.time()
+            self.timeout_handle = self._loop.call_later(
+                RECV_TIMEOUT, self._check_timeout
+            )
         _LOGGER.debug(" - connection from: %s", transport.get_extra_info("peername"))
 
     def data_received(self, data) -> None:
@@ -75,10 +121,7 @@ class Ser2NetProtocol(asyncio.Protocol):
         option = None
 
         if self.timeout_handle:
-            self.timeout_handle.cancel()
-            self.timeout_handle = self._loop.call_later(
-                RECV_TIMEOUT, self._recv_timeout
-            )
+            self._last_recv = self._loop.time()  # _check_timeout() will re-arm
 
         if int(data[0], 16) == IAC:  # telnet IAC
             # see: https://users.cs.cf.ac.uk/Dave.Marshall/Internet/node141.html
@@ -95,19 +138,15 @@ class Ser2NetProtocol(asyncio.Protocol):
             return
 
         try:
-            cmd = "".join(
-                c
-                for c in data.decode("ascii", errors="ignore").strip()
-                if c in printable
-            )
+            cmd = data.translate(None, _NON_PRINTABLE).strip().decode("ascii")
         except UnicodeDecodeError:
             return
+        if not cmd:
+            return
 
         # pkt = Packet(cmd)
         # cmd = Command(pkt)
-        # self._que.put_nowait(cmd)  # TODO: use factory: shld be Command, not str
-        # TODO: the previous line be something like
-        self._gwy.send_data(cmd)
+        self._cmd_que.put_nowait(cmd)  # TODO: use factory: shld be Command, not str
         _LOGGER.debug(" - command sent to dispatch queue: %s", cmd)
 
     def eof_received(self) -> Optional[bool]:
@@ -126,10 +165,20 @@ class Ser2NetServer:
     def __init__(self, addr_port, cmd_que, loop=None) -> None:
         _LOGGER.debug("Ser2NetServer.__init__(%s, %s)", addr_port, cmd_que)
 
-        self._addr, self._port = addr_port.split(":")
+        if addr_port.startswith("unix:"):  # e.g. unix:/run/evohome/ser2net.sock
+            # a Unix domain socket skips the TCP/IP stack for on-host clients
+            self._path = addr_port[5:]
+            self._addr = self._port = None
+        else:
+            self._path = None
+            self._addr, self._port = addr_port.split(":")
+        self._cmd_que = cmd_que if cmd_que is not None else DequeQueue()
         self._loop = loop if loop else asyncio.get_running_loop()
         self.protocol = self.server = None
 
+        self._outbox = []  # outbound packets, flushed (in order) once per loop tick
+        self._flush_scheduled = False
+
     def _send_timeout(self):
         _LOGGER.debug("Ser2NetServer._send_timeout()")
         self.protocol.transport.close()
@@ -139,12 +188,29 @@ class Ser2NetServer:
     async def start(self) -> None:
         _LOGGER.debug("Ser2NetServer.start()")
 
-        self.protocol = Ser2NetProtocol()
-        self.server = await self._loop.create_server(
-            lambda: self.protocol, self._addr, int(self._port)
-        )
-        self._loop.create_task(self.server.serve_forever())
-        _LOGGER.debug(" - listening on %s:%s", self._addr, int(self._port))
+        self.protocol = Ser2NetProtocol(self._loop, self._cmd_que)
+        if self._path:
+            self.server = await self._loop.create_unix_server(
+                lambda: self.protocol, path=self._path
+            )
+            self._loop.create_task(self.server.serve_forever())
+            _LOGGER.debug(" - listening on %s", self._path)
+        else:
+            self.server = await self._loop.create_server(
+                lambda: self.protocol, self._addr, int(self._port)
+            )
+            self._loop.create_task(self.server.serve_forever())
+            _LOGGER.debug(" - listening on %s:%s", self._addr, int(self._port))
+
+    def _flush(self) -> None:
+        packets, self._outbox = self._outbox, []
+        self._flush_scheduled = False
+
+        if self.protocol.transport and not self.protocol.transport.is_closing():
+            self.protocol.transport.writelines(packets)
+            _LOGGER.debug(" - data sent to network: %s", packets)
+        else:
+            _LOGGER.debug(" - no active network socket, unable to relay")
 
     async def write(self, data: str) -> None:
         _LOGGER.debug("Ser2NetServer.write(%s)", data)
@@ -152,11 +218,12 @@ class Ser2NetServer:
         packet = f"{data}\r\n".encode("ascii")
         _LOGGER.debug(" - packet is: %s", packet)
 
-        if self.protocol.transport and not self.protocol.transport.is_closing():
-            self.protocol.transport.write(packet)
-            _LOGGER.debug(" - data sent to network: %s", packet)
-        else:
-            _LOGGER.debug(" - no active network socket, unable to relay")
+        # batch small writes: one writelines() amortizes the syscall over all
+        # the packets queued during this loop tick (ordering is preserved)
+        self._outbox.append(packet)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self._loop.call_soon(self._flush)
 
 
 """This is how to invoke the code:
@@ -3,10 +3,11 @@
 #
 """Evohome RF - The evohome-compatible system."""
 
+import asyncio
+from collections import Counter
 from datetime import timedelta as td
 import json
 import logging
-from threading import Lock
 from typing import List, Optional
 
 from .command import Priority, FaultLog
@@ -17,7 +18,6 @@ from .const import (
     ATTR_DHW_VALVE_HTG,
     ATTR_SYSTEM,
     ATTR_ZONE_SENSOR,
-    DEVICE_HAS_ZONE_SENSOR,
     DISCOVER_SCHEMA,
     DISCOVER_PARAMS,
     DISCOVER_STATUS,
@@ -28,7 +28,7 @@ from .const import (
 )
 from .devices import Device, Entity
 from .exceptions import CorruptStateError, ExpiredCallbackError
-from .helpers import dtm_to_hex
+from .helpers import dtm_to_hex, LazyStr
 from .schema import (
     ATTR_HTG_CONTROL,
     ATTR_ORPHANS,
@@ -43,6 +43,14 @@ from .zones import DhwZone, Zone
 
 DEV_MODE = _dev_mode_
 
+# discovery payloads are constant - hoisted so _discover needn't rebuild them
+_DISCOVER_0005_ZONES = ("08", "09", "0A", "0B", "11")  # CODE_0005_ZONE_TYPE
+_DISCOVER_0005_OTHER = ("00", "04", "0C", "0F", "10")  # as per an RFG100
+_DISCOVER_000C_TYPES = ("000D", "000F")  # CODE_000C_DEVICE_TYPE
+
+# the only codes that mutate SystemBase state - all others can short-circuit
+_SYSTEM_STATE_CODES = frozenset(("0008", "3150"))
+
 _LOGGER = logging.getLogger(__name__)
 if DEV_MODE:
     _LOGGER.setLevel(logging.DEBUG)
@@ -363,9 +371,16 @@ class MultiZone:  # 0005 (+/- 000C?)
         self.zones = []
         self.zone_by_idx = {}
         # self.zone_by_name = {}
+        self._sensorless_zone_idxs = set()  # zones that have no sensor (yet)
+        self._valid_zone_idxs = frozenset(  # set lookup, not int(idx, 16) per call
+            f"{i:02X}" for i in range(self._gwy.config[MAX_ZONES] + 1)
+        )
+
+        self._zones_schema_cache = None
+        self._zones_schema_ver = None  # gwy._schema_ver when the cache was built
 
-        self.zone_lock = Lock()
-        self.zone_lock_idx = None
+        # serializes schedule Rx/Tx across zones (one 0404 transfer at a time)
+        self.zone_lock = asyncio.Lock()
 
         # self._prev_30c9 = None  # OUT: used to discover zone sensors
 
@@ -373,15 +388,13 @@ class MultiZone:  # 0005 (+/- 000C?)
         super()._discover(discover_flag=discover_flag)
 
         if discover_flag & DISCOVER_SCHEMA:
-            [  # 0005: find any zones + their type (RAD, UFH, VAL, MIX, ELE)
+            # 0005: find any zones + their type (RAD, UFH, VAL, MIX, ELE)
+            for zone_type in _DISCOVER_0005_ZONES:
                 self._send_cmd("0005", payload=f"00{zone_type}")
-                for zone_type in ("08", "09", "0A", "0B", "11")  # CODE_0005_ZONE_TYPE
-            ]
 
-            [  # 0005: find any others - as per an RFG100
+            # 0005: find any others - as per an RFG100
+            for zone_type in _DISCOVER_0005_OTHER:
                 self._send_cmd("0005", payload=f"00{zone_type}")
-                for zone_type in ("00", "04", "0C", "0F", "10")
-            ]
 
     def _handle_msg(self, msg, prev_msg=None):
         def OUT_find_zone_sensors() -> None:
@@ -402,7 +415,7 @@ class MultiZone:  # 0005 (+/- 000C?)
             if prev_msg is None:
                 return
 
-            if len([z for z in self.zones if z.sensor is None]) == 0:
+            if not self._sensorless_zone_idxs:
                 return  # (currently) no zone without a sensor
 
             # if self._gwy.serial_port:  # only if in monitor mode...
@@ -421,11 +434,13 @@ class MultiZone:  # 0005 (+/- 000C?)
             if not changed_zones:
                 return  # ctl's 30C9 says no zones have changed temps during this cycle
 
+            temp_counts = Counter(changed_zones.values())
             testable_zones = {
                 z: t
                 for z, t in changed_zones.items()
-                if self.zone_by_idx[z].sensor is None
-                and t not in [v for k, v in changed_zones.items() if k != z] + [None]
+                if z in self._sensorless_zone_idxs
+                and t is not None
+                and temp_counts[t] == 1
             }  # ...with unique (non-null) temps, and no sensor
             _LOGGER.debug(
                 " - with unique/non-null temps (from 30C9), no sensor (from state): %s",
@@ -436,22 +451,23 @@ class MultiZone:  # 0005 (+/- 000C?)
 
             testable_sensors = [
                 d
-                for d in self._gwy.devices  # not: self.devices
-                if d._ctl in (self, None)
-                and d.addr.type in DEVICE_HAS_ZONE_SENSOR
-                and d.temperature is not None
+                for d in (
+                    self._gwy._sensor_candidates.get(self.id, [])
+                    + self._gwy._sensor_candidates.get(None, [])
+                )  # pre-filtered by device type, not: all of self._gwy.devices
+                if d.temperature is not None
+                and d._msgs.get("30C9")
                 and d._msgs["30C9"].dtm > prev_msg.dtm  # changed temp during last cycle
             ]
 
-            if _LOGGER.isEnabledFor(logging.DEBUG):
-                _LOGGER.debug(
-                    "Testable zones: %s (unique/non-null temps & sensorless)",
-                    testable_zones,
-                )
-                _LOGGER.debug(
-                    "Testable sensors: %s (non-null temps & orphans or zoneless)",
-                    {d.id: d.temperature for d in testable_sensors},
-                )
+            _LOGGER.debug(
+                "Testable zones: %s (unique/non-null temps & sensorless)",
+                testable_zones,
+            )
+            _LOGGER.debug(
+                "Testable sensors: %s (non-null temps & orphans or zoneless)",
+                LazyStr(lambda: {d.id: d.temperature for d in testable_sensors}),
+            )
 
             if testable_sensors:  # the main matching algorithm...
                 for zone_idx, temp in testable_zones.items():
@@ -464,7 +480,7 @@ class MultiZone:  # 0005 (+/- 000C?)
                     _LOGGER.debug("Testing zone %s, temp: %s", zone_idx, temp)
                     _LOGGER.debug(
                         " - matching sensor(s): %s (same temp & not from another zone)",
-                        [s.id for s in matching_sensors],
+                        LazyStr(lambda: [s.id for s in matching_sensors]),
                     )
 
                     if len(matching_sensors) == 1:
@@ -482,13 +498,13 @@ class MultiZone:  # 0005 (+/- 000C?)
             # now see if we can allocate the controller as a sensor...
             if self._zone is not None:
                 return  # the controller has already been allocated
-            if len([z for z in self.zones if z.sensor is None]) != 1:
+            if len(self._sensorless_zone_idxs) != 1:
                 return  # no single zone without a sensor
 
             testable_zones = {
                 z: t
                 for z, t in changed_zones.items()
-                if self.zone_by_idx[z].sensor is None
+                if z in self._sensorless_zone_idxs
             }  # this will be true if ctl is sensor
             if not testable_zones:
                 return  # no testable zones
@@ -508,7 +524,7 @@ class MultiZone:  # 0005 (+/- 000C?)
 
             _LOGGER.debug(
                 " - matching sensor(s): %s (excl. controller)",
-                [s.id for s in matching_sensors],
+                LazyStr(lambda: [s.id for s in matching_sensors]),
             )
 
             # can safely(?) assume this zone is using the CTL as a sensor...
@@ -556,7 +572,7 @@ class MultiZone:  # 0005 (+/- 000C?)
         if zone_idx == "HW":
             return super()._get_zone(zone_idx, sensor=sensor, **kwargs)
 
-        if int(zone_idx, 16) <= self._gwy.config[MAX_ZONES]:
+        if zone_idx in self._valid_zone_idxs:
             zone = self.zone_by_idx.get(zone_idx)
             if zone is None:
                 zone = create_zone(zone_idx)
@@ -568,6 +584,7 @@ class MultiZone:  # 0005 (+/- 000C?)
                 for device in [d for d in kwargs["actuators"] if d not in zone.devices]:
                     zone.devices.append(device)
                     zone.device_by_id[device.id] = device
+                    self._gwy._schema_ver += 1
 
         else:
             raise ValueError(f"Unknown zone_idx/domain_id: {zone_idx}")
@@ -583,9 +600,14 @@ class MultiZone:  # 0005 (+/- 000C?)
 
     @property
     def schema(self) -> dict:
+        # each z.schema traverses that zone's devices - only rebuild the dict
+        # if a zone (or a zone's sensor/type/devices) has changed
+        if self._zones_schema_ver != self._gwy._schema_ver:
+            self._zones_schema_cache = {z.idx: z.schema for z in self._zones}
+            self._zones_schema_ver = self._gwy._schema_ver
         return {
             **super().schema,
-            ATTR_ZONES: {z.idx: z.schema for z in self._zones},
+            ATTR_ZONES: self._zones_schema_cache,
         }
 
     @property
@@ -627,22 +649,29 @@ class SystemBase(Entity):  # 3B00 (multi-relay)
         self._dhw_valve = None
         self._htg_valve = None
 
+        self._schema_cache = None
+        self._schema_ver = None  # gwy._schema_ver when the cache was built
+        self._str_cache = None
+        self._str_ver = None  # gwy._schema_ver when the cache was serialized
+
     def __repr__(self) -> str:
         return f"{self._ctl.id} (controller)"
 
     def __str__(self) -> str:  # TODO: WIP
-        return json.dumps({self._ctl.id: self.schema})
+        if self._str_ver != self._gwy._schema_ver:
+            self._str_cache = json.dumps({self._ctl.id: self.schema})
+            self._str_ver = self._gwy._schema_ver
+        return self._str_cache
 
     def _discover(self, discover_flag=DISCOVER_ALL) -> None:
         # super()._discover(discover_flag=discover_flag)
 
         if discover_flag & DISCOVER_SCHEMA:
-            [  # 000C: find the HTG relay and DHW sensor, if any (DHW relays in DHW)
-                self._send_cmd("000C", payload=dev_type)
-                for dev_type in ("000D", "000F")  # CODE_000C_DEVICE_TYPE
+            # 000C: find the HTG relay and DHW sensor, if any (DHW relays in DHW)
+            for dev_type in _DISCOVER_000C_TYPES:
                 # for dev_type, description in CODE_000C_DEVICE_TYPE.items() fix payload
                 # if description is not None
-            ]
+                self._send_cmd("000C", payload=dev_type)
 
         if discover_flag & DISCOVER_PARAMS:
             self._send_cmd("1100", payload="FC")  # TPI params
@@ -709,11 +738,14 @@ class SystemBase(Entity):  # 3B00 (multi-relay)
             if heater is not None:
                 self._set_htg_control(heater)
 
-        if msg.code in ("000A", "2309", "30C9") and not isinstance(msg.payload, list):
+        if msg.code in ("000A", "2309", "30C9") and not msg.is_array:
             pass
         else:
             super()._handle_msg(msg)
 
+        if msg.code not in _SYSTEM_STATE_CODES:  # short-circuit the common case
+            return
+
         if msg.code == "0008" and msg.verb in (" I", "RP"):
             if "domain_id" in msg.payload:
                 self._relay_demands[msg.payload["domain_id"]] = msg
@@ -888,10 +920,21 @@ class SystemBase(Entity):  # 3B00 (multi-relay)
         if self._htg_control.actuator_state:
             return True
 
+    async def schema_json(self, **kwargs) -> str:
+        """Return the system's schema as JSON, serialized off the event loop."""
+        return await self._gwy._loop.run_in_executor(
+            None, lambda: json.dumps(self.schema, **kwargs)
+        )
+
     @property
     def schema(self) -> dict:
         """Return the system's schema."""
 
+        # scanning/sorting the device list is O(N log N) - only redo it if a
+        # device has been added, or has changed parent, since the last build
+        if self._schema_ver == self._gwy._schema_ver:
+            return self._schema_cache
+
         schema = {ATTR_CONTROLLER: self._ctl.id}
 
         # devices without a parent zone, NB: CTL can be a sensor for a zones
@@ -917,6 +960,7 @@ class SystemBase(Entity):  # 3B00 (multi-relay)
             )
         }
 
+        self._schema_cache, self._schema_ver = schema, self._gwy._schema_ver
         return schema
 
     @property
@@ -1044,7 +1088,7 @@ class Evohome(SysLanguage, SysMode, MultiZone, StoredHw, System):  # evohome
         #     else:
         #         xxx(msg.payload)
 
-        if msg.code in ("000A", "2309", "30C9") and isinstance(msg.payload, list):
+        if msg.code in ("000A", "2309", "30C9") and msg.is_array:
             pass
 
     @property
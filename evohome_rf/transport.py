@@ -530,14 +530,17 @@ class PacketProtocolQos(PacketProtocol):
         self._timeout_full = None
         self._timeout_half = None
 
-    def _timeouts(self, dtm: dt) -> Tuple[dt, dt]:
+    def _timeouts(self, now: float) -> None:
+        # deadlines are loop.time() floats: monotonic, and far cheaper to take
+        # and compare (every 5 ms, in the send loop) than a datetime
         if self._qos_cmd:
             if self._tx_hdr:
                 timeout = QOS_TX_TIMEOUT
             else:
                 timeout = self._qos_cmd.qos.get("timeout", QOS_RX_TIMEOUT)
-            self._timeout_full = dtm + timeout * 2 ** self._backoff
-            self._timeout_half = dtm + timeout * 2 ** (self._backoff - 1)
+            secs = timeout.total_seconds()
+            self._timeout_full = now + secs * 2 ** self._backoff
+            self._timeout_half = now + secs * 2 ** (self._backoff - 1)
 
         # if self._timeout_half >= dtm:
         #     self._backoff = max(self._backoff - 1, 0)
@@ -593,7 +596,7 @@ class PacketProtocolQos(PacketProtocol):
             # NOTE: is the Tx pkt, but is a *duplicate* - we've already seen it!
             elif pkt._header == self._qos_cmd.tx_header:
                 msg = "duplicated Tx pkt (still wanting the Rx pkt)"
-                self._timeouts(dt.now())  # TODO: increase backoff?
+                self._timeouts(self._loop.time())  # TODO: increase backoff?
 
             # NOTE: is the Rx pkt, and is a non-Null (expected) response
             elif pkt._header == self._rx_hdr:
@@ -615,11 +618,11 @@ class PacketProtocolQos(PacketProtocol):
                     "Tx" if self._tx_hdr else "Rx"
                 ) + " pkt)"
 
-            self._timeouts(dt.now())
+            self._timeouts(self._loop.time())
             _logger_rcvd(_LOGGER.debug, f"CHECKED - {msg}")
 
         # else:  # no outstanding cmd - ?throttle down the backoff
-        #     # self._timeouts(dt.now())
+        #     # self._timeouts(self._loop.time())
         #     _logger_rcvd(_LOGGER.debug, "XXXXXXX - ")
 
         if self._callback and self.is_wanted(pkt, self._include, self._exclude):
@@ -661,11 +664,11 @@ class PacketProtocolQos(PacketProtocol):
         self._tx_retries = 0
         self._tx_retry_limit = cmd.qos.get("retries", QOS_TX_RETRIES)
 
-        self._timeouts(dt.now())
+        self._timeouts(self._loop.time())
         await self._send_data(bytes(f"{cmd}\r\n".encode("ascii")))
 
         while self._qos_cmd is not None:  # until sent (may need re-transmit) or expired
-            if self._timeout_full > dt.now():
+            if self._timeout_full > self._loop.time():
                 await asyncio.sleep(0.005)
 
             elif self._qos_cmd is None:  # can be set to None by data_received
@@ -676,7 +679,7 @@ class PacketProtocolQos(PacketProtocol):
                 self._tx_retries += 1
                 if not self._qos_cmd.qos.get("disable_backoff", False):
                     self._backoff = min(self._backoff + 1, QOS_MAX_BACKOFF)
-                self._timeouts(dt.now())
+                self._timeouts(self._loop.time())
                 await self._send_data(bytes(f"{cmd}\r\n".encode("ascii")))
                 _logger_send(
                     _LOGGER.warning,
@@ -693,7 +696,7 @@ class PacketProtocolQos(PacketProtocol):
                 break
 
         else:
-            if self._timeout_half >= dt.now():
+            if self._timeout_half >= self._loop.time():
                 self._backoff = max(self._backoff - 1, 0)
             # _logger_send(_LOGGER.debug, "SENT OK")
 
@@ -37,6 +37,8 @@ from .ramses import RAMSES_ZONES, RAMSES_ZONES_ALL
 
 DEV_MODE = _dev_mode_
 
+_DISCOVER_000C_TYPES = ("00", "04")  # CODE_000C_ZONE_TYPE
+
 _LOGGER = logging.getLogger(__name__)
 if DEV_MODE:
     _LOGGER.setLevel(logging.DEBUG)
@@ -454,6 +456,8 @@ class Zone(ZoneSchedule, ZoneBase):
         # self.id = f"{ctl.id}_{zone_idx}"
         ctl.zones.append(self)
         ctl.zone_by_idx[zone_idx] = self
+        ctl._sensorless_zone_idxs.add(zone_idx)
+        self._gwy._schema_ver += 1
         # ctl.zone_by_name[self.name] = self
 
         self.devices = []
@@ -493,10 +497,9 @@ class Zone(ZoneSchedule, ZoneBase):
 
         # TODO: add code to determine zone type if it doesn't have one, using 0005s
 
-        [  # 000C: find the sensor and the actuators, if any
+        # 000C: find the sensor and the actuators, if any
+        for dev_type in _DISCOVER_000C_TYPES:  # TODO: use 08, not 00
             self._send_cmd("000C", payload=f"{self.idx}{dev_type}")
-            for dev_type in ("00", "04")  # CODE_000C_ZONE_TYPE
-        ]  # TODO: use 08, not 00
 
         # start collecting the schedule
         # self._schedule.req_schedule()  # , restart=True) start collecting schedule
@@ -507,7 +510,7 @@ class Zone(ZoneSchedule, ZoneBase):
     def _handle_msg(self, msg) -> bool:
         super()._handle_msg(msg)
 
-        if isinstance(msg.payload, list):
+        if msg.is_array:
             assert self.idx in [d["zone_idx"] for d in msg.payload]
 
         if msg.code == "0004":
@@ -566,6 +569,7 @@ class Zone(ZoneSchedule, ZoneBase):
 
         if self._sensor is None:
             self._sensor = device
+            self._evo._sensorless_zone_idxs.discard(self.idx)
             device._set_parent(self)
 
     @property
@@ -626,6 +630,7 @@ class Zone(ZoneSchedule, ZoneBase):
 
         self._zone_type = _type
         self.__class__ = ZONE_CLASSES[_type]
+        self._gwy._schema_ver += 1
         _LOGGER.debug("Zone %s: type now set to %s", self.id, self._zone_type)
 
         self._discover()  # TODO: needs tidyup (ref #67)
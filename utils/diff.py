@@ -140,14 +140,14 @@ def main():
         pass
 
     elif args.debug_mode > 1:
-        import ptvsd
+        import debugpy
 
+        debugpy.listen(address=(DEBUG_ADDR, DEBUG_PORT))
         print(f"Debugging is enabled, listening on: {DEBUG_ADDR}:{DEBUG_PORT}.")
-        ptvsd.enable_attach(address=(DEBUG_ADDR, DEBUG_PORT))
 
         if args.debug_mode > 2:
             print("Execution paused, waiting for debugger to attach...")
-            ptvsd.wait_for_attach()
+            debugpy.wait_for_client()
             print("Debugger is attached, continuing execution.")
 
     compare(args)